@@ -5,10 +5,12 @@ import json
 import os
 import sys
 
+from gitcommit_ai.core.cache import ResponseCache
 from gitcommit_ai.core.config import Config
 from gitcommit_ai.core.git import GitError, GitOperations
 from gitcommit_ai.generator.generator import CommitMessageGenerator
 from gitcommit_ai.generator.message import CommitMessage
+from gitcommit_ai.providers.openai import OpenAIProvider
 
 
 def _log_commit_stats(
@@ -264,6 +266,10 @@ async def run_generate(args: argparse.Namespace) -> None:
         print(f"Error: No API key for {provider}", file=sys.stderr)
         sys.exit(3)
 
+    # Connect to OpenAI while the staged diff is being collected
+    if provider == "openai":
+        OpenAIProvider.start_warmup()
+
     # Determine if gitmoji should be used
     use_gitmoji = False
     if hasattr(args, "gitmoji") and args.gitmoji:
@@ -281,13 +287,18 @@ async def run_generate(args: argparse.Namespace) -> None:
             generator = CommitMessageGenerator(provider=provider, api_key=api_key)
             multi_gen = MultiSuggestionGenerator()
 
+            # Read the staged diff once and share it across suggestions
+            diff = await asyncio.to_thread(GitOperations.get_staged_diff)
+
             async def generate_fn(temp: float) -> 'CommitMessage':
-                # Temporarily modify provider temperature (simplified)
-                return await generator.generate()
+                # Each suggestion samples at its own temperature for variety
+                return await generator.generate(temperature=temp, diff=diff)
 
+            # Remote APIs handle parallel requests, so send them together
             suggestions = await multi_gen.generate_multiple(
                 count=args.count,
-                generate_fn=generate_fn
+                generate_fn=generate_fn,
+                concurrency=args.count,
             )
 
             # JSON mode: output all suggestions
@@ -313,8 +324,11 @@ async def run_generate(args: argparse.Namespace) -> None:
                 print("No message selected, commit cancelled", file=sys.stderr)
                 sys.exit(1)
         else:
-            # Single message generation
-            generator = CommitMessageGenerator(provider=provider, api_key=api_key)
+            # Single message generation (cached unless --no-cache)
+            cache = None if getattr(args, "no_cache", False) else ResponseCache()
+            generator = CommitMessageGenerator(
+                provider=provider, api_key=api_key, cache=cache
+            )
             message = await generator.generate()
 
         # Calculate response time
@@ -361,6 +375,18 @@ async def run_generate(args: argparse.Namespace) -> None:
         sys.exit(2)
 
 
+async def run_generate_and_close(args: argparse.Namespace) -> None:
+    """Run the generate command and release shared HTTP connections.
+
+    Args:
+        args: Parsed command-line arguments.
+    """
+    try:
+        await run_generate(args)
+    finally:
+        await OpenAIProvider.aclose()
+
+
 def run_install_hooks(args: argparse.Namespace) -> None:
     """Run the install-hooks command."""
     from pathlib import Path
@@ -582,6 +608,11 @@ def main() -> None:
         action="store_true",
         help="Disable emoji prefix (even if enabled in config)",
     )
+    generate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the AI provider instead of reusing a cached message",
+    )
     generate_parser.add_argument(
         "--count",
         type=int,
@@ -646,7 +677,7 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "generate":
-        asyncio.run(run_generate(args))
+        asyncio.run(run_generate_and_close(args))
     elif args.command == "install-hooks":
         run_install_hooks(args)
     elif args.command == "uninstall-hooks":
@@ -0,0 +1,94 @@
+"""On-disk cache for AI-generated commit messages."""
+import hashlib
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from gitcommit_ai.generator.message import CommitMessage, GitDiff
+
+# Entries older than this are treated as misses
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class ResponseCache:
+    """Exact-match cache mapping (model, prompt, diff) to a CommitMessage.
+
+    Each entry is a JSON file named by a hash of the key. Entries expire
+    based on file modification time.
+    """
+
+    def __init__(
+        self, cache_dir: Path | None = None, ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cache entries
+                       (defaults to ~/.gitcommit-ai/cache/responses).
+            ttl_seconds: Maximum age of a usable entry.
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".gitcommit-ai" / "cache" / "responses"
+
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(model: str, prompt: str, diff: GitDiff) -> str:
+        """Build the cache key for a model, rendered prompt and staged diff.
+
+        The diff content is hashed alongside the prompt because prompts may
+        only summarize the change (paths and line counts).
+
+        Args:
+            model: Model name.
+            prompt: Rendered prompt sent to the model.
+            diff: Staged changes the prompt was built from.
+
+        Returns:
+            Hex digest identifying the entry.
+        """
+        digest = hashlib.blake2b(f"{model}\0{prompt}".encode())
+        for file in diff.files:
+            digest.update(f"\0{file.path}\0{file.diff_content}".encode())
+        return digest.hexdigest()
+
+    def get(self, model: str, prompt: str, diff: GitDiff) -> CommitMessage | None:
+        """Look up a cached message.
+
+        Args:
+            model: Model name.
+            prompt: Rendered prompt sent to the model.
+            diff: Staged changes the prompt was built from.
+
+        Returns:
+            Cached CommitMessage, or None on miss or expired entry.
+        """
+        path = self.cache_dir / f"{self.make_key(model, prompt, diff)}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return CommitMessage(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def set(
+        self, model: str, prompt: str, diff: GitDiff, message: CommitMessage
+    ) -> None:
+        """Store a generated message.
+
+        Args:
+            model: Model name.
+            prompt: Rendered prompt sent to the model.
+            diff: Staged changes the prompt was built from.
+            message: CommitMessage to cache.
+        """
+        path = self.cache_dir / f"{self.make_key(model, prompt, diff)}.json"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(asdict(message)), encoding="utf-8")
+        except OSError:
+            # Silently fail - caching should never break generation
+            pass
@@ -1,8 +1,10 @@
 """Commit message generator orchestration."""
+import asyncio
 from typing import Literal
 
+from gitcommit_ai.core.cache import ResponseCache
 from gitcommit_ai.core.git import GitOperations
-from gitcommit_ai.generator.message import CommitMessage
+from gitcommit_ai.generator.message import CommitMessage, GitDiff
 from gitcommit_ai.providers.anthropic import AnthropicProvider
 from gitcommit_ai.providers.base import AIProvider
 from gitcommit_ai.providers.deepseek import DeepSeekProvider
@@ -13,13 +15,17 @@ class CommitMessageGenerator:
     """Orchestrates git diff extraction and AI message generation."""
 
     def __init__(
-        self, provider: Literal["openai", "anthropic", "deepseek"], api_key: str
+        self,
+        provider: Literal["openai", "anthropic", "deepseek"],
+        api_key: str,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize generator with AI provider.
 
         Args:
             provider: AI provider name ("openai", "anthropic", or "deepseek").
             api_key: API key for the provider.
+            cache: Optional response cache (used by the OpenAI provider).
 
         Raises:
             ValueError: If provider is unknown.
@@ -27,7 +33,7 @@ class CommitMessageGenerator:
         self.provider: AIProvider
 
         if provider == "openai":
-            self.provider = OpenAIProvider(api_key=api_key)
+            self.provider = OpenAIProvider(api_key=api_key, cache=cache)
         elif provider == "anthropic":
             self.provider = AnthropicProvider(api_key=api_key)
         elif provider == "deepseek":
@@ -35,9 +41,16 @@ class CommitMessageGenerator:
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
-    async def generate(self) -> CommitMessage:
+    async def generate(
+        self, temperature: float | None = None, diff: GitDiff | None = None
+    ) -> CommitMessage:
         """Generate commit message for staged changes.
 
+        Args:
+            temperature: Optional sampling temperature (OpenAI provider only;
+                         other providers use their own setting).
+            diff: Already-collected staged diff; read from git when omitted.
+
         Returns:
             CommitMessage object.
 
@@ -45,10 +58,17 @@ class CommitMessageGenerator:
             GitError: If git operations fail.
             Exception: If AI provider fails.
         """
-        # Extract staged diff
-        diff = GitOperations.get_staged_diff()
+        # Extract staged diff off the event loop so pending network
+        # work (e.g. connection warm-up) can progress meanwhile
+        if diff is None:
+            diff = await asyncio.to_thread(GitOperations.get_staged_diff)
 
         # Generate message using AI
-        message = await self.provider.generate_commit_message(diff)
+        if temperature is not None and isinstance(self.provider, OpenAIProvider):
+            message = await self.provider.generate_commit_message(
+                diff, temperature=temperature
+            )
+        else:
+            message = await self.provider.generate_commit_message(diff)
 
         return message
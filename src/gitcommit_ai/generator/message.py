@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileDiff:
     """Represents changes to a single file."""
 
@@ -14,7 +14,7 @@ class FileDiff:
     diff_content: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitDiff:
     """Represents the complete staged diff."""
 
@@ -23,7 +23,7 @@ class GitDiff:
     total_deletions: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommitMessage:
     """Structured commit message following conventional commits format."""
 
@@ -1,4 +1,5 @@
 """Multi-suggestion generator for commit messages."""
+import asyncio
 from collections.abc import Awaitable, Callable
 
 from gitcommit_ai.generator.message import CommitMessage
@@ -10,13 +11,17 @@ class MultiSuggestionGenerator:
     async def generate_multiple(
         self,
         count: int,
-        generate_fn: Callable[[float], Awaitable[CommitMessage]]
+        generate_fn: Callable[[float], Awaitable[CommitMessage]],
+        concurrency: int = 1,
     ) -> list[CommitMessage]:
         """Generate multiple suggestions with different temperatures.
 
         Args:
             count: Number of suggestions to generate (1-10).
             generate_fn: Async function that takes temperature and returns CommitMessage.
+            concurrency: Maximum calls in flight at once. Defaults to 1
+                         (one after another), which suits local backends
+                         such as Ollama that queue concurrent requests.
 
         Returns:
             List of CommitMessage suggestions.
@@ -34,10 +39,14 @@ class MultiSuggestionGenerator:
             step = (0.7 - 0.3) / (count - 1)
             temperatures = [0.3 + i * step for i in range(count)]
 
-        # Generate suggestions
-        suggestions = []
-        for temp in temperatures:
-            message = await generate_fn(temp)
-            suggestions.append(message)
+        if concurrency <= 1:
+            return [await generate_fn(temp) for temp in temperatures]
 
-        return suggestions
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(temp: float) -> CommitMessage:
+            async with semaphore:
+                return await generate_fn(temp)
+
+        # Results keep temperature order regardless of completion order
+        return list(await asyncio.gather(*(bounded(temp) for temp in temperatures)))
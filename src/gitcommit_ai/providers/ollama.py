@@ -73,14 +73,16 @@ class OllamaProvider(AIProvider):
             True if 'ollama' command exists, False otherwise.
         """
         try:
+            # Only the exit code matters, so discard output instead of decoding it
             result = subprocess.run(
                 ["ollama", "--version"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
+                timeout=2,
             )
             return result.returncode == 0
-        except FileNotFoundError:
+        except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
     @staticmethod
@@ -1,30 +1,157 @@
 """OpenAI provider for commit message generation."""
+import asyncio
+import random
 import re
 
 import httpx
 
+from gitcommit_ai.core.cache import ResponseCache
 from gitcommit_ai.generator.message import CommitMessage, GitDiff
+from gitcommit_ai.prompts.loader import PromptLoader
 from gitcommit_ai.providers.base import AIProvider
 
 
 class OpenAIProvider(AIProvider):
     """OpenAI API provider for generating commit messages."""
 
-    def __init__(self, api_key: str | None) -> None:
+    # First line of a conventional commit: type(scope): description
+    COMMIT_LINE_PATTERN = re.compile(r"^(\w+)(?:\(([^)]+)\))?: (.+)$")
+
+    # Wrappers some models put before the message: a code fence or a label
+    PREAMBLE_PATTERN = re.compile(r"^(?:```[\w-]*\n|commit message:\s*)", re.IGNORECASE)
+
+    # Request parts that never change between calls
+    BASE_HEADERS = {"Content-Type": "application/json"}
+    SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a commit message generator. Generate concise conventional commit messages.",
+    }
+
+    # Prompt template is read from disk once per process
+    _loader: PromptLoader | None = None
+    _template: str | None = None
+
+    API_BASE = "https://api.openai.com/v1"
+
+    # Total attempts for transient errors (rate limit, service unavailable);
+    # any other status is returned or raised without retrying
+    MAX_ATTEMPTS = {429: 3, 503: 2}
+    MAX_RETRY_DELAY = 10.0
+
+    # Near-deterministic sampling gives stable output and cache hits
+    DEFAULT_TEMPERATURE = 0.2
+
+    # Shared across instances so repeated calls reuse pooled connections
+    _client: httpx.AsyncClient | None = None
+    _client_loop: asyncio.AbstractEventLoop | None = None
+    _warmup_task: asyncio.Task[None] | None = None
+
+    def __init__(
+        self,
+        api_key: str | None,
+        model: str = "gpt-4o-mini",
+        cache: ResponseCache | None = None,
+    ) -> None:
         """Initialize OpenAI provider.
 
         Args:
             api_key: OpenAI API key.
+            model: Model name (e.g., gpt-4o-mini, gpt-4o).
+            cache: Optional response cache to skip repeat API calls.
         """
         self.api_key = api_key
-        self.model = "gpt-4o-mini"
-        self.api_url = "https://api.openai.com/v1/chat/completions"
+        self._auth_header = f"Bearer {api_key}"
+        self.cache = cache
+        self.model = model
+        self.api_url = f"{self.API_BASE}/chat/completions"
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        HTTP/2 is enabled so concurrent requests multiplex over a single
+        connection. Pooled connections are bound to the event loop that
+        opened them, so a new client is created whenever the running loop
+        changes.
+
+        Returns:
+            Shared httpx.AsyncClient instance.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            cls._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=30.0,
+                http2=True,
+            )
+            cls._client_loop = loop
+        return cls._client
+
+    @classmethod
+    def start_warmup(cls) -> None:
+        """Open a pooled connection to the API in the background.
 
-    async def generate_commit_message(self, diff: GitDiff) -> CommitMessage:
+        DNS lookup and the TCP/TLS handshakes then overlap with local work
+        such as collecting the staged diff, so the first real request finds
+        a warm connection. Must be called from a running event loop.
+        """
+        cls._warmup_task = asyncio.create_task(cls._warmup())
+
+    @classmethod
+    async def _warmup(cls) -> None:
+        """Send a cheap request to establish the connection."""
+        try:
+            await cls._get_client().head(f"{cls.API_BASE}/models", timeout=5.0)
+        except Exception:
+            # Warm-up is best-effort - the real request reports network errors
+            pass
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if cls._warmup_task is not None:
+            cls._warmup_task.cancel()
+            await asyncio.gather(cls._warmup_task, return_exceptions=True)
+            cls._warmup_task = None
+        if cls._client is not None:
+            await cls._client.aclose()
+        cls._client = None
+        cls._client_loop = None
+
+    @classmethod
+    async def generate_many(
+        cls, configs: list[tuple[str | None, str]], diff: GitDiff
+    ) -> list[CommitMessage]:
+        """Generate messages for several (api_key, model) pairs concurrently.
+
+        All requests go through the shared client, so with HTTP/2 they are
+        sent as parallel streams over a single connection.
+
+        Args:
+            configs: List of (api_key, model) pairs.
+            diff: GitDiff object with staged changes.
+
+        Returns:
+            CommitMessages in the same order as configs.
+
+        Raises:
+            Exception: If any API call fails.
+        """
+        providers = [cls(api_key=api_key, model=model) for api_key, model in configs]
+        return list(
+            await asyncio.gather(*(p.generate_commit_message(diff) for p in providers))
+        )
+
+    async def generate_commit_message(
+        self, diff: GitDiff, temperature: float | None = None
+    ) -> CommitMessage:
         """Generate commit message using OpenAI API.
 
         Args:
             diff: GitDiff object with staged changes.
+            temperature: Sampling temperature. When given, the cache is
+                         bypassed so repeated calls can produce varied
+                         suggestions; defaults to DEFAULT_TEMPERATURE.
 
         Returns:
             CommitMessage in conventional commit format.
@@ -34,36 +161,71 @@ class OpenAIProvider(AIProvider):
         """
         prompt = self._build_prompt(diff)
 
-        async with httpx.AsyncClient() as client:
+        # Explicit temperatures ask for fresh samples, so skip the cache
+        cache = self.cache if temperature is None else None
+
+        if cache is not None:
+            cached = cache.get(self.model, prompt, diff)
+            if cached is not None:
+                return cached
+
+        client = self._get_client()
+        headers = {**self.BASE_HEADERS, "Authorization": self._auth_header}
+        payload = {
+            "model": self.model,
+            "messages": [self.SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "temperature": (
+                self.DEFAULT_TEMPERATURE if temperature is None else temperature
+            ),
+            "top_p": 1.0,
+            "max_tokens": 200,
+        }
+
+        attempt = 1
+        while True:
             response = await client.post(
-                self.api_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a commit message generator. Generate concise conventional commit messages.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 200,
-                },
-                timeout=30.0,
+                self.api_url, headers=headers, json=payload, timeout=30.0
             )
+            max_attempts = self.MAX_ATTEMPTS.get(response.status_code, 1)
+            if attempt >= max_attempts:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+
+        if response.status_code != 200:
+            error_data = response.json()
+            error_msg = error_data.get("error", {}).get("message", "Unknown error")
+            raise Exception(f"OpenAI API error: {error_msg}")
 
-            if response.status_code != 200:
-                error_data = response.json()
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                raise Exception(f"OpenAI API error: {error_msg}")
+        data = response.json()
+        message_text = data["choices"][0]["message"]["content"]
+        message, is_conventional = self._parse_response(message_text)
+
+        # Fallbacks are not cached, so a re-run can get a proper message
+        if cache is not None and is_conventional:
+            cache.set(self.model, prompt, diff, message)
+        return message
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Compute how long to wait before retrying a transient error.
+
+        Args:
+            response: Failed response (may carry a Retry-After header).
+            attempt: Number of attempts made so far.
 
-            data = response.json()
-            message_text = data["choices"][0]["message"]["content"]
-            return self._parse_message(message_text)
+        Returns:
+            Delay in seconds (Retry-After if given, else exponential backoff
+            with jitter), capped at MAX_RETRY_DELAY.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.MAX_RETRY_DELAY)
+            except ValueError:
+                # HTTP-date form is not supported; fall back to backoff
+                pass
+        delay = 2.0 ** (attempt - 1) + random.random() * 0.3
+        return min(delay, self.MAX_RETRY_DELAY)
 
     def validate_config(self) -> list[str]:
         """Validate OpenAI configuration.
@@ -85,17 +247,17 @@ class OpenAIProvider(AIProvider):
         Returns:
             Rendered prompt string.
         """
-        from gitcommit_ai.prompts.loader import PromptLoader
-
         file_list = "\n".join(
-            f"- {f.path} (+{f.additions} -{f.deletions})" for f in diff.files
+            [f"- {f.path} (+{f.additions} -{f.deletions})" for f in diff.files]
         )
 
-        loader = PromptLoader()
-        template = loader.load("openai")
+        cls = type(self)
+        if cls._loader is None or cls._template is None:
+            cls._loader = PromptLoader()
+            cls._template = cls._loader.load("openai")
 
-        return loader.render(
-            template,
+        return cls._loader.render(
+            cls._template,
             file_list=file_list,
             total_additions=diff.total_additions,
             total_deletions=diff.total_deletions
@@ -110,20 +272,31 @@ class OpenAIProvider(AIProvider):
         Returns:
             CommitMessage object.
         """
-        lines = text.strip().split("\n")
+        return self._parse_response(text)[0]
+
+    def _parse_response(self, text: str) -> tuple[CommitMessage, bool]:
+        """Parse AI response, reporting whether it was a conventional commit.
+
+        Args:
+            text: AI-generated message text.
+
+        Returns:
+            Tuple of (CommitMessage, is_conventional); is_conventional is
+            False when the chore fallback was used.
+        """
+        text = self.PREAMBLE_PATTERN.sub("", text.strip(), count=1)
+        text = text.removesuffix("```").strip()
+
+        # A header's colon comes early; without one, skip splitting the text
+        if ":" not in text[:80]:
+            return self._fallback_message(text.partition("\n")[0]), False
+
+        lines = text.split("\n")
         first_line = lines[0].strip()
 
-        # Parse first line: type(scope): description
-        match = re.match(r"^(\w+)(?:\(([^)]+)\))?: (.+)$", first_line)
+        match = self.COMMIT_LINE_PATTERN.match(first_line)
         if not match:
-            # Fallback if format doesn't match
-            return CommitMessage(
-                type="chore",
-                scope=None,
-                description=first_line[:50],
-                body=None,
-                breaking_changes=[],
-            )
+            return self._fallback_message(first_line), False
 
         commit_type, scope, description = match.groups()
 
@@ -132,10 +305,28 @@ class OpenAIProvider(AIProvider):
         if len(lines) > 2 and lines[1] == "":
             body = "\n".join(lines[2:]).strip()
 
-        return CommitMessage(
+        message = CommitMessage(
             type=commit_type,
             scope=scope,
             description=description,
             body=body,
             breaking_changes=[],
         )
+        return message, True
+
+    def _fallback_message(self, first_line: str) -> CommitMessage:
+        """Build a chore message when the response isn't a conventional commit.
+
+        Args:
+            first_line: First line of the AI response.
+
+        Returns:
+            CommitMessage object.
+        """
+        return CommitMessage(
+            type="chore",
+            scope=None,
+            description=first_line.strip()[:50],
+            body=None,
+            breaking_changes=[],
+        )
@@ -1,18 +1,50 @@
 """Provider registry for managing AI providers."""
+import functools
 import os
-import subprocess
+import shutil
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderInfo:
     """Information about an AI provider."""
     name: str
     configured: bool
-    models: list[str]
+    models: tuple[str, ...]
     description: str
 
 
+# Environment variables that mark a cloud provider as configured
+_API_KEY_ENV_VARS: dict[str, tuple[str, ...]] = {
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    "mistral": ("MISTRAL_API_KEY",),
+    "cohere": ("COHERE_API_KEY",),
+    "deepseek": ("DEEPSEEK_API_KEY",),
+}
+
+# Supported models per provider, shared by every ProviderInfo
+_MODELS_BY_PROVIDER: dict[str, tuple[str, ...]] = {
+    "openai": ("gpt-4o", "gpt-4o-mini"),
+    "anthropic": ("claude-3-opus", "claude-3-sonnet", "claude-3-haiku"),
+    "gemini": ("gemini-2.0-flash-001", "gemini-2.5-flash", "gemini-2.5-pro"),
+    "mistral": ("mistral-tiny", "mistral-small", "mistral-medium"),
+    "cohere": ("command", "command-light"),
+    "deepseek": ("deepseek-chat", "deepseek-coder"),
+    "ollama": ("qwen2.5:7b", "qwen2.5:3b", "llama3.2", "codellama"),
+}
+
+# All provider names, in display order
+_PROVIDER_NAMES: tuple[str, ...] = (*_API_KEY_ENV_VARS, "ollama")
+
+
+@functools.cache
+def _ollama_on_path() -> bool:
+    """Check once per process whether the ollama binary is on PATH."""
+    return shutil.which("ollama") is not None
+
+
 class ProviderRegistry:
     """Registry for all available AI providers."""
 
@@ -26,62 +58,67 @@ class ProviderRegistry:
         providers = [
             ProviderInfo(
                 name="openai",
-                configured=bool(os.getenv("OPENAI_API_KEY")),
-                models=["gpt-4o", "gpt-4o-mini"],
+                configured=ProviderRegistry._is_configured("openai"),
+                models=_MODELS_BY_PROVIDER["openai"],
                 description="OpenAI GPT models"
             ),
             ProviderInfo(
                 name="anthropic",
-                configured=bool(os.getenv("ANTHROPIC_API_KEY")),
-                models=["claude-3-opus", "claude-3-sonnet", "claude-3-haiku"],
+                configured=ProviderRegistry._is_configured("anthropic"),
+                models=_MODELS_BY_PROVIDER["anthropic"],
                 description="Anthropic Claude models"
             ),
             ProviderInfo(
                 name="gemini",
-                configured=bool(os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")),
-                models=["gemini-2.0-flash-001", "gemini-2.5-flash", "gemini-2.5-pro"],
+                configured=ProviderRegistry._is_configured("gemini"),
+                models=_MODELS_BY_PROVIDER["gemini"],
                 description="Google Gemini models"
             ),
             ProviderInfo(
                 name="mistral",
-                configured=bool(os.getenv("MISTRAL_API_KEY")),
-                models=["mistral-tiny", "mistral-small", "mistral-medium"],
+                configured=ProviderRegistry._is_configured("mistral"),
+                models=_MODELS_BY_PROVIDER["mistral"],
                 description="Mistral AI models"
             ),
             ProviderInfo(
                 name="cohere",
-                configured=bool(os.getenv("COHERE_API_KEY")),
-                models=["command", "command-light"],
+                configured=ProviderRegistry._is_configured("cohere"),
+                models=_MODELS_BY_PROVIDER["cohere"],
                 description="Cohere Command models"
             ),
             ProviderInfo(
                 name="deepseek",
-                configured=bool(os.getenv("DEEPSEEK_API_KEY")),
-                models=["deepseek-chat", "deepseek-coder"],
+                configured=ProviderRegistry._is_configured("deepseek"),
+                models=_MODELS_BY_PROVIDER["deepseek"],
                 description="DeepSeek models (cheapest: $0.27/1M tokens)"
             ),
             ProviderInfo(
                 name="ollama",
-                configured=ProviderRegistry._check_ollama(),
-                models=["qwen2.5:7b", "qwen2.5:3b", "llama3.2", "codellama"],
+                configured=ProviderRegistry._is_configured("ollama"),
+                models=_MODELS_BY_PROVIDER["ollama"],
                 description="Ollama (local AI models)"
             ),
         ]
         return providers
 
+    @staticmethod
+    def _is_configured(name: str) -> bool:
+        """Check whether a single provider is ready to use.
+
+        Args:
+            name: Provider name.
+
+        Returns:
+            True if the provider's API key is set (or Ollama is installed).
+        """
+        if name == "ollama":
+            return ProviderRegistry._check_ollama()
+        return any(os.getenv(var) for var in _API_KEY_ENV_VARS[name])
+
     @staticmethod
     def _check_ollama() -> bool:
-        """Check if Ollama is installed and running."""
-        try:
-            result = subprocess.run(
-                ["ollama", "--version"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        """Check if Ollama is installed (without spawning a process)."""
+        return _ollama_on_path()
 
     @staticmethod
     def get_provider_names() -> list[str]:
@@ -90,7 +127,7 @@ class ProviderRegistry:
         Returns:
             List of provider names (lowercase).
         """
-        return [p.name for p in ProviderRegistry.list_providers()]
+        return list(_PROVIDER_NAMES)
 
     @staticmethod
     def get_configured_providers() -> list[str]:
@@ -99,4 +136,4 @@ class ProviderRegistry:
         Returns:
             List of configured provider names.
         """
-        return [p.name for p in ProviderRegistry.list_providers() if p.configured]
+        return [name for name in _PROVIDER_NAMES if ProviderRegistry._is_configured(name)]
@@ -22,3 +22,6 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: marks tests as slow running"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keeps tests on one pytest-xdist worker"
+    )
@@ -1,54 +1,80 @@
 """End-to-end CLI integration tests."""
+import shutil
 import subprocess
-import tempfile
+import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from gitcommit_ai.cli.main import main
-
-
+from gitcommit_ai.generator.message import CommitMessage
+
+
+@pytest.fixture(scope="session")
+def _template_git_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create git repo with staged changes once per test session."""
+    repo_path = tmp_path_factory.mktemp("template_repo")
+
+    # Initialize git
+    subprocess.run(
+        ["git", "init"],
+        cwd=repo_path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Append identity to .git/config directly instead of two `git config` calls
+    with (repo_path / ".git" / "config").open("a", encoding="utf-8") as config:
+        config.write("[user]\n\temail = test@example.com\n\tname = Test User\n")
+
+    # Create and stage a file
+    test_file = repo_path / "feature.py"
+    test_file.write_text("def new_feature():\n    pass\n")
+    subprocess.run(
+        ["git", "add", "feature.py"],
+        cwd=repo_path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    return repo_path
+
+
+@pytest.mark.xdist_group(name="cli_e2e")
 class TestCLIEndToEnd:
     """Test CLI end-to-end workflows."""
 
     @pytest.fixture
-    def temp_git_repo_with_changes(self):
-        """Create git repo with staged changes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-
-            # Initialize git
-            subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
-            subprocess.run(
-                ["git", "config", "user.email", "test@example.com"],
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "config", "user.name", "Test User"],
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-            )
-
-            # Create and stage a file
-            test_file = repo_path / "feature.py"
-            test_file.write_text("def new_feature():\n    pass\n")
-            subprocess.run(["git", "add", "feature.py"], cwd=repo_path, check=True)
-
-            yield repo_path
+    def temp_git_repo_with_changes(self, tmp_path: Path, _template_git_repo: Path) -> Path:
+        """Copy of the template repo that a test may freely modify."""
+        repo_path = tmp_path / "repo"
+        shutil.copytree(_template_git_repo, repo_path)
+        return repo_path
 
     def test_cli_generate_with_mocked_ai(
-        self, temp_git_repo_with_changes: Path
+        self,
+        temp_git_repo_with_changes: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """CLI generates commit message with mocked AI provider."""
-        import os
-
-        with patch("gitcommit_ai.generator.generator.CommitMessageGenerator.generate") as mock_generate:
-            from gitcommit_ai.generator.message import CommitMessage
-
+        monkeypatch.setattr(
+            sys, "argv", ["gitcommit-ai", "generate", "--provider", "openai", "--no-cache"]
+        )
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test123")
+        monkeypatch.chdir(temp_git_repo_with_changes)
+
+        with (
+            patch(
+                "gitcommit_ai.generator.generator.CommitMessageGenerator.generate",
+                new_callable=AsyncMock,
+            ) as mock_generate,
+            patch("gitcommit_ai.providers.openai.OpenAIProvider.start_warmup"),
+            patch("gitcommit_ai.cli.main._log_commit_stats"),
+        ):
             mock_generate.return_value = CommitMessage(
                 type="feat",
                 scope="api",
@@ -57,50 +83,39 @@ class TestCLIEndToEnd:
                 breaking_changes=[],
             )
 
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_git_repo_with_changes)
+            main()
 
-                # This would normally run CLI, but we're testing the flow
-                # Full E2E test would require subprocess.run with CLI entry point
-                assert True  # Placeholder for actual CLI invocation test
-            finally:
-                os.chdir(original_cwd)
+        mock_generate.assert_awaited_once()
+        assert "feat(api): add new feature endpoint" in capsys.readouterr().out
 
-    def test_cli_providers_list_command(self) -> None:
+    def test_cli_providers_list_command(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """CLI lists available providers."""
-        # Mock the CLI command execution
-        with patch("sys.argv", ["gitcommit-ai", "providers", "list"]):
-            with patch("gitcommit_ai.cli.main.print") as mock_print:
-                with patch("gitcommit_ai.cli.main.sys.exit"):
-                    try:
-                        main()
-                    except SystemExit:
-                        pass
-
-                    # Verify providers were listed
-                    print_calls = [str(call) for call in mock_print.call_args_list]
-                    # At least some provider names should be printed
-                    assert len(print_calls) > 0
-
-    def test_cli_hooks_install_command(self, temp_git_repo_with_changes: Path) -> None:
+        monkeypatch.setattr(sys, "argv", ["gitcommit-ai", "providers", "list"])
+        monkeypatch.setattr(sys, "exit", lambda *args, **kwargs: None)
+
+        main()
+
+        out = capsys.readouterr().out
+        assert "Available AI Providers" in out
+        assert "openai" in out
+        assert "ollama" in out
+
+    def test_cli_hooks_install_command(
+        self,
+        temp_git_repo_with_changes: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """CLI installs git hooks."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_git_repo_with_changes)
-
-            with patch("sys.argv", ["gitcommit-ai", "install-hooks"]):
-                with patch("gitcommit_ai.cli.main.print"):
-                    with patch("gitcommit_ai.cli.main.sys.exit"):
-                        try:
-                            main()
-                        except SystemExit:
-                            pass
-
-            # Check that hook was created
-            hook_path = temp_git_repo_with_changes / ".git" / "hooks" / "prepare-commit-msg"
-            assert hook_path.exists()
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.setattr(sys, "argv", ["gitcommit-ai", "install-hooks"])
+        monkeypatch.setattr(sys, "exit", lambda *args, **kwargs: None)
+        monkeypatch.chdir(temp_git_repo_with_changes)
+
+        main()
+        assert "hooks installed successfully" in capsys.readouterr().out
+
+        # Check that hook was created
+        hook_path = temp_git_repo_with_changes / ".git" / "hooks" / "prepare-commit-msg"
+        assert hook_path.exists()
@@ -1,4 +1,5 @@
 """Integration tests for git operations."""
+import os
 import subprocess
 import tempfile
 from pathlib import Path
@@ -37,8 +38,6 @@ class TestGitIntegration:
 
     def test_is_git_repository_in_real_repo(self, temp_git_repo: Path) -> None:
         """Detects real git repository."""
-        import os
-
         original_cwd = os.getcwd()
         try:
             os.chdir(temp_git_repo)
@@ -49,8 +48,6 @@ class TestGitIntegration:
     def test_is_git_repository_outside_repo(self) -> None:
         """Returns False outside git repository."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
             original_cwd = os.getcwd()
             try:
                 os.chdir(tmpdir)
@@ -60,8 +57,6 @@ class TestGitIntegration:
 
     def test_has_staged_changes_with_staged_file(self, temp_git_repo: Path) -> None:
         """Detects staged changes."""
-        import os
-
         # Create and stage a file
         test_file = temp_git_repo / "test.txt"
         test_file.write_text("Hello, world!")
@@ -77,8 +72,6 @@ class TestGitIntegration:
 
     def test_get_staged_diff_returns_diff(self, temp_git_repo: Path) -> None:
         """Returns diff for staged changes."""
-        import os
-
         # Create and stage a file
         test_file = temp_git_repo / "test.txt"
         test_file.write_text("Test content\n")
@@ -97,8 +90,6 @@ class TestGitIntegration:
 
     def test_create_commit_makes_commit(self, temp_git_repo: Path) -> None:
         """Creates actual git commit."""
-        import os
-
         # Create and stage a file
         test_file = temp_git_repo / "test.txt"
         test_file.write_text("Initial commit\n")
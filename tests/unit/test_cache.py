@@ -0,0 +1,99 @@
+"""Tests for the on-disk response cache."""
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from gitcommit_ai.core.cache import ResponseCache
+from gitcommit_ai.generator.message import CommitMessage, FileDiff, GitDiff
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    """Create a cache rooted in a temporary directory."""
+    return ResponseCache(cache_dir=tmp_path / "responses")
+
+
+def make_diff(diff_content: str) -> GitDiff:
+    """Build a one-file diff for src/auth.py (+1 -1) with the given content."""
+    return GitDiff(
+        files=[
+            FileDiff(
+                path="src/auth.py",
+                change_type="modified",
+                additions=1,
+                deletions=1,
+                diff_content=diff_content,
+            )
+        ],
+        total_additions=1,
+        total_deletions=1,
+    )
+
+
+@pytest.fixture
+def diff() -> GitDiff:
+    """Create a sample GitDiff."""
+    return make_diff("-old\n+new")
+
+
+@pytest.fixture
+def message() -> CommitMessage:
+    """Create a sample CommitMessage."""
+    return CommitMessage(
+        type="feat",
+        scope="api",
+        description="add endpoint",
+        body="Details here.",
+        breaking_changes=[],
+    )
+
+
+class TestResponseCache:
+    """Test cache lookups, storage and expiry."""
+
+    def test_miss_returns_none(self, cache: ResponseCache, diff: GitDiff) -> None:
+        """Unknown keys return None."""
+        assert cache.get("gpt-4o-mini", "prompt", diff) is None
+
+    def test_roundtrip(
+        self, cache: ResponseCache, diff: GitDiff, message: CommitMessage
+    ) -> None:
+        """Stored messages are returned intact."""
+        cache.set("gpt-4o-mini", "prompt", diff, message)
+        assert cache.get("gpt-4o-mini", "prompt", diff) == message
+
+    def test_key_includes_model(
+        self, cache: ResponseCache, diff: GitDiff, message: CommitMessage
+    ) -> None:
+        """Same prompt for a different model is a miss."""
+        cache.set("gpt-4o-mini", "prompt", diff, message)
+        assert cache.get("gpt-4o", "prompt", diff) is None
+
+    def test_expired_entry_is_miss(
+        self, cache: ResponseCache, diff: GitDiff, message: CommitMessage
+    ) -> None:
+        """Entries older than the TTL are ignored."""
+        cache.set("gpt-4o-mini", "prompt", diff, message)
+        path = cache.cache_dir / f"{ResponseCache.make_key('gpt-4o-mini', 'prompt', diff)}.json"
+        old = time.time() - cache.ttl_seconds - 1
+        os.utime(path, (old, old))
+
+        assert cache.get("gpt-4o-mini", "prompt", diff) is None
+
+    def test_corrupt_entry_is_miss(self, cache: ResponseCache, diff: GitDiff) -> None:
+        """Unreadable entries are treated as misses."""
+        cache.cache_dir.mkdir(parents=True)
+        path = cache.cache_dir / f"{ResponseCache.make_key('gpt-4o-mini', 'prompt', diff)}.json"
+        path.write_text("{not json")
+
+        assert cache.get("gpt-4o-mini", "prompt", diff) is None
+
+    def test_key_includes_diff_content(
+        self, cache: ResponseCache, message: CommitMessage
+    ) -> None:
+        """Same prompt for a diff with different content is a miss."""
+        cache.set("gpt-4o-mini", "prompt", make_diff("-old\n+new"), message)
+
+        assert cache.get("gpt-4o-mini", "prompt", make_diff("-old\n+other")) is None
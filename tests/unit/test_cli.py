@@ -1,11 +1,14 @@
 """Tests for CLI interface."""
+import argparse
+import asyncio
 import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from gitcommit_ai.cli.main import main
-from gitcommit_ai.generator.message import CommitMessage
+from gitcommit_ai.cli.main import format_output, main, run_generate
+from gitcommit_ai.core.config import Config
+from gitcommit_ai.generator.message import CommitMessage, GitDiff
 
 
 class TestCLIArgumentParsing:
@@ -55,8 +58,6 @@ class TestCLIOutput:
                 with patch("sys.argv", ["gitcommit-ai", "generate"]):
                     with patch("os.getenv", return_value="sk-test123"):
                         # Would normally call main() but need to mock async
-                        from gitcommit_ai.cli.main import format_output
-
                         output = format_output(mock_message, json_format=False)
                         assert "feat(cli): add output formatting" in output
                         assert not output.startswith("{")
@@ -72,8 +73,6 @@ class TestCLIOutput:
             breaking_changes=[],
         )
 
-        from gitcommit_ai.cli.main import format_output
-
         output = format_output(mock_message, json_format=True)
         data = json.loads(output)
 
@@ -90,8 +89,6 @@ class TestCLIErrorHandling:
         # This test verifies that Ollama is used as default when no API keys present
         # The actual generation would require Ollama to be installed, so we just
         # verify the config logic is correct
-        from gitcommit_ai.core.config import Config
-
         with patch.dict("os.environ", {}, clear=True):
             config = Config.load()
             assert config.default_provider == "ollama"
@@ -108,6 +105,31 @@ class TestCLIErrorHandling:
                         main()
                     assert exc_info.value.code == 1
 
+    @pytest.mark.asyncio
+    async def test_openai_without_api_key_skips_warmup(self) -> None:
+        """No connection to OpenAI is opened when the API key is missing."""
+        args = argparse.Namespace(
+            provider="openai",
+            model=None,
+            json=False,
+            verbose=False,
+            gitmoji=False,
+            no_gitmoji=False,
+            count=1,
+        )
+
+        with (
+            patch("gitcommit_ai.core.git.GitOperations.is_git_repository", return_value=True),
+            patch("gitcommit_ai.core.git.GitOperations.has_staged_changes", return_value=True),
+            patch.dict("os.environ", {}, clear=True),
+            patch("gitcommit_ai.providers.openai.OpenAIProvider.start_warmup") as mock_warmup,
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                await run_generate(args)
+
+        assert exc_info.value.code == 3
+        mock_warmup.assert_not_called()
+
 
 class TestCLIMultipleSuggestions:
     """Test CLI multiple suggestions feature (--count flag)."""
@@ -115,11 +137,6 @@ class TestCLIMultipleSuggestions:
     @pytest.mark.asyncio
     async def test_cli_ollama_supports_count_flag(self) -> None:
         """Ollama provider supports --count flag for multiple suggestions."""
-        import argparse
-
-        from gitcommit_ai.cli.main import run_generate
-        from gitcommit_ai.generator.message import GitDiff
-
         mock_messages = [
             CommitMessage(
                 type="feat",
@@ -156,6 +173,92 @@ class TestCLIMultipleSuggestions:
                                 assert isinstance(data, list)
                                 assert len(data) == 3
 
+    @pytest.mark.asyncio
+    async def test_cli_ollama_count_generates_serially(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Ollama --count runs one generation at a time (local server queues)."""
+        args = argparse.Namespace(
+            provider="ollama",
+            model=None,
+            json=True,
+            verbose=False,
+            gitmoji=False,
+            no_gitmoji=False,
+            count=3,
+        )
+        in_flight = [0]
+        peak = [0]
+
+        async def fake_generate(diff: GitDiff) -> CommitMessage:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return CommitMessage("feat", None, "add feature", None, [])
+
+        with (
+            patch("gitcommit_ai.core.git.GitOperations.is_git_repository", return_value=True),
+            patch("gitcommit_ai.core.git.GitOperations.has_staged_changes", return_value=True),
+            patch(
+                "gitcommit_ai.core.git.GitOperations.get_staged_diff",
+                return_value=GitDiff(files=[], total_additions=1, total_deletions=0),
+            ),
+            patch("gitcommit_ai.providers.ollama.OllamaProvider.validate_config", return_value=[]),
+            patch(
+                "gitcommit_ai.providers.ollama.OllamaProvider.generate_commit_message",
+                side_effect=fake_generate,
+            ),
+        ):
+            await run_generate(args)
+
+        assert peak[0] == 1
+        assert len(json.loads(capsys.readouterr().out)) == 3
+
+    @pytest.mark.asyncio
+    async def test_cli_openai_count_reads_diff_once(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """OpenAI --count shares one staged diff and sends requests together."""
+        args = argparse.Namespace(
+            provider="openai",
+            model=None,
+            json=True,
+            verbose=False,
+            gitmoji=False,
+            no_gitmoji=False,
+            count=3,
+        )
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test123")
+        in_flight = [0]
+        peak = [0]
+
+        async def fake_generate(diff: GitDiff, temperature: float | None = None) -> CommitMessage:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return CommitMessage("feat", None, f"add feature {temperature}", None, [])
+
+        with (
+            patch("gitcommit_ai.core.git.GitOperations.is_git_repository", return_value=True),
+            patch("gitcommit_ai.core.git.GitOperations.has_staged_changes", return_value=True),
+            patch(
+                "gitcommit_ai.core.git.GitOperations.get_staged_diff",
+                return_value=GitDiff(files=[], total_additions=1, total_deletions=0),
+            ) as mock_diff,
+            patch("gitcommit_ai.providers.openai.OpenAIProvider.start_warmup"),
+            patch(
+                "gitcommit_ai.providers.openai.OpenAIProvider.generate_commit_message",
+                side_effect=fake_generate,
+            ),
+        ):
+            await run_generate(args)
+
+        mock_diff.assert_called_once()
+        assert peak[0] == 3
+        assert len(json.loads(capsys.readouterr().out)) == 3
+
     @pytest.mark.asyncio
     async def test_cli_ollama_count_validation(self) -> None:
         """Ollama --count flag validates range (1-10)."""
@@ -1,6 +1,7 @@
 """Tests for Cohere provider."""
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from gitcommit_ai.generator.message import CommitMessage, FileDiff, GitDiff
@@ -61,8 +62,6 @@ class TestCohereProvider:
         self, sample_diff: GitDiff
     ) -> None:
         """Raises exception when API returns error."""
-        import httpx
-
         with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
             mock_response = MagicMock(status_code=429)
             mock_post.return_value = mock_response
@@ -79,8 +78,6 @@ class TestCohereProvider:
         self, sample_diff: GitDiff
     ) -> None:
         """Raises exception on network failure."""
-        import httpx
-
         with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
             mock_post.side_effect = httpx.RequestError("Connection timeout")
 
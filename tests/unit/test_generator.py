@@ -60,6 +60,27 @@ class TestCommitMessageGenerator:
                 assert message == mock_message
                 mock_provider.assert_called_once_with(sample_diff)
 
+    @pytest.mark.asyncio
+    async def test_generate_passes_temperature_to_openai(
+        self, sample_diff: GitDiff
+    ) -> None:
+        """Explicit temperature reaches the OpenAI provider."""
+        with patch(
+            "gitcommit_ai.core.git.GitOperations.get_staged_diff"
+        ) as mock_git:
+            mock_git.return_value = sample_diff
+
+            with patch(
+                "gitcommit_ai.providers.openai.OpenAIProvider.generate_commit_message",
+                new_callable=AsyncMock,
+            ) as mock_provider:
+                generator = CommitMessageGenerator(
+                    provider="openai", api_key="sk-test123"
+                )
+                await generator.generate(temperature=0.7)
+
+                mock_provider.assert_called_once_with(sample_diff, temperature=0.7)
+
     @pytest.mark.asyncio
     async def test_generate_uses_anthropic_provider(
         self, sample_diff: GitDiff
@@ -1,5 +1,7 @@
 """Tests for Gitmoji mapper."""
 
+import pytest
+
 from gitcommit_ai.generator.message import CommitMessage
 
 
@@ -34,24 +36,25 @@ class TestGitmojiMapping:
         emoji = GitmojiMapper.get_emoji("unknown")
         assert emoji is None
 
-    def test_all_standard_mappings(self):
+    @pytest.mark.parametrize(
+        ("commit_type", "expected_emoji"),
+        [
+            ("feat", "✨"),
+            ("fix", "🐛"),
+            ("docs", "📝"),
+            ("style", "🎨"),
+            ("refactor", "♻️"),
+            ("test", "✅"),
+            ("chore", "🔧"),
+            ("perf", "🚀"),
+            ("security", "🔒"),
+        ],
+    )
+    def test_all_standard_mappings(self, commit_type, expected_emoji):
         """Test all standard gitmoji mappings."""
         from gitcommit_ai.gitmoji.mapper import GitmojiMapper
 
-        expected = {
-            "feat": "✨",
-            "fix": "🐛",
-            "docs": "📝",
-            "style": "🎨",
-            "refactor": "♻️",
-            "test": "✅",
-            "chore": "🔧",
-            "perf": "🚀",
-            "security": "🔒",
-        }
-
-        for commit_type, expected_emoji in expected.items():
-            assert GitmojiMapper.get_emoji(commit_type) == expected_emoji
+        assert GitmojiMapper.get_emoji(commit_type) == expected_emoji
 
 
 class TestGitmojiFormatting:
@@ -1,6 +1,7 @@
 """Tests for Mistral AI provider."""
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from gitcommit_ai.generator.message import CommitMessage, FileDiff, GitDiff
@@ -62,8 +63,6 @@ class TestMistralProvider:
         self, sample_diff: GitDiff
     ) -> None:
         """Raises exception when API returns error."""
-        import httpx
-
         with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
             mock_response = MagicMock(status_code=401)
             mock_post.return_value = mock_response
@@ -80,8 +79,6 @@ class TestMistralProvider:
         self, sample_diff: GitDiff
     ) -> None:
         """Raises exception on network failure."""
-        import httpx
-
         with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
             mock_post.side_effect = httpx.RequestError("Connection failed")
 
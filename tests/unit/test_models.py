@@ -1,4 +1,7 @@
 """Tests for data models (GitDiff, CommitMessage)."""
+from dataclasses import FrozenInstanceError
+
+import pytest
 
 from gitcommit_ai.generator.message import CommitMessage, FileDiff, GitDiff
 
@@ -44,6 +47,19 @@ class TestFileDiff:
         assert diff.change_type == "deleted"
         assert diff.additions == 0
 
+    def test_file_diff_is_immutable(self) -> None:
+        """FileDiff fields cannot be reassigned and carry no __dict__."""
+        diff = FileDiff(
+            path="src/main.py",
+            change_type="modified",
+            additions=1,
+            deletions=0,
+            diff_content="+x",
+        )
+        with pytest.raises(FrozenInstanceError):
+            diff.additions = 2  # type: ignore[misc]
+        assert not hasattr(diff, "__dict__")
+
 
 class TestGitDiff:
     """Test GitDiff dataclass."""
@@ -134,16 +150,29 @@ class TestCommitMessage:
         assert "BREAKING CHANGE:" in formatted
         assert "Response now returns JSON object" in formatted
 
-    def test_commit_message_types(self) -> None:
+    @pytest.mark.parametrize(
+        "commit_type", ["feat", "fix", "docs", "style", "refactor", "test", "chore"]
+    )
+    def test_commit_message_types(self, commit_type: str) -> None:
         """CommitMessage supports all conventional commit types."""
-        types = ["feat", "fix", "docs", "style", "refactor", "test", "chore"]
-        for commit_type in types:
-            msg = CommitMessage(
-                type=commit_type,
-                scope=None,
-                description="test description",
-                body=None,
-                breaking_changes=[],
-            )
-            assert msg.type == commit_type
-            assert commit_type in msg.format()
+        msg = CommitMessage(
+            type=commit_type,
+            scope=None,
+            description="test description",
+            body=None,
+            breaking_changes=[],
+        )
+        assert msg.type == commit_type
+        assert commit_type in msg.format()
+
+    def test_commit_message_is_immutable(self) -> None:
+        """CommitMessage fields cannot be reassigned."""
+        message = CommitMessage(
+            type="feat",
+            scope=None,
+            description="add x",
+            body=None,
+            breaking_changes=[],
+        )
+        with pytest.raises(FrozenInstanceError):
+            message.type = "fix"  # type: ignore[misc]
@@ -1,4 +1,6 @@
 """Tests for MultiSuggestionGenerator."""
+import asyncio
+
 import pytest
 
 from gitcommit_ai.generator.message import CommitMessage
@@ -96,3 +98,50 @@ class TestMultiSuggestionGenerator:
         # Count too high
         with pytest.raises(ValueError, match="count must be between 1 and 10"):
             await generator.generate_multiple(count=11, generate_fn=mock_generate)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("concurrency", "expected_peak"),
+        [(2, 2), (4, 4)],
+    )
+    async def test_concurrency_bounds_calls_in_flight(
+        self, concurrency: int, expected_peak: int
+    ) -> None:
+        """At most `concurrency` generate calls run at the same time."""
+        generator = MultiSuggestionGenerator()
+        in_flight = [0]
+        peak = [0]
+
+        async def mock_generate(temp: float) -> CommitMessage:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return CommitMessage("feat", None, f"message {temp:.1f}", None, [], None)
+
+        suggestions = await generator.generate_multiple(
+            count=4, generate_fn=mock_generate, concurrency=concurrency
+        )
+
+        assert peak[0] == expected_peak
+        assert [s.description for s in suggestions] == [
+            "message 0.3", "message 0.4", "message 0.6", "message 0.7"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequential_by_default(self) -> None:
+        """Without a concurrency bound, calls never overlap."""
+        generator = MultiSuggestionGenerator()
+        in_flight = [0]
+        peak = [0]
+
+        async def mock_generate(temp: float) -> CommitMessage:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return CommitMessage("feat", None, "message", None, [], None)
+
+        await generator.generate_multiple(count=3, generate_fn=mock_generate)
+
+        assert peak[0] == 1
@@ -1,6 +1,9 @@
 """Tests for Ollama provider."""
+import inspect
+import subprocess
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from gitcommit_ai.generator.message import CommitMessage, FileDiff, GitDiff
@@ -80,9 +83,10 @@ class TestOllamaDetection:
         assert OllamaProvider.is_installed() is True
         mock_run.assert_called_once_with(
             ["ollama", "--version"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False,
+            timeout=2,
         )
 
     @patch("subprocess.run")
@@ -91,6 +95,12 @@ class TestOllamaDetection:
         mock_run.side_effect = FileNotFoundError()
         assert OllamaProvider.is_installed() is False
 
+    @patch("subprocess.run")
+    def test_is_not_installed_when_command_hangs(self, mock_run):
+        """Test is_installed returns False when ollama does not respond."""
+        mock_run.side_effect = subprocess.TimeoutExpired(["ollama", "--version"], 2)
+        assert OllamaProvider.is_installed() is False
+
     @patch("subprocess.run")
     def test_list_models_success(self, mock_run):
         """Test list_models parses output correctly."""
@@ -195,8 +205,6 @@ class TestOllamaProvider:
     @pytest.mark.asyncio
     async def test_check_service_running_fails_on_connection_error(self):
         """Test check_service_running returns False on connection error."""
-        import httpx
-
         provider = OllamaProvider()
         provider.client.get = AsyncMock(side_effect=httpx.ConnectError("timeout"))
 
@@ -210,8 +218,6 @@ class TestOllamaStreamingParser:
     @pytest.mark.asyncio
     async def test_stream_response_accumulates_chunks(self):
         """Test _stream_response accumulates response chunks."""
-        from unittest.mock import MagicMock
-
         provider = OllamaProvider()
 
         # Mock streaming response
@@ -239,8 +245,6 @@ class TestOllamaStreamingParser:
     @pytest.mark.asyncio
     async def test_stream_response_handles_malformed_json(self):
         """Test _stream_response skips malformed JSON lines."""
-        from unittest.mock import MagicMock
-
         provider = OllamaProvider()
 
         async def mock_aiter_lines():
@@ -480,10 +484,6 @@ class TestOllamaGenerationParameters:
 
     def test_stream_response_builds_payload_with_options(self) -> None:
         """T127-T130: _stream_response builds payload with all generation options."""
-        import inspect
-
-        from gitcommit_ai.providers.ollama import OllamaProvider
-
         provider = OllamaProvider()
 
         # Read the _stream_response source code to verify payload structure
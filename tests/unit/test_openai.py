@@ -1,15 +1,21 @@
 """Tests for OpenAI provider."""
+import json
+import re
+from collections.abc import AsyncIterator
+from dataclasses import replace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from gitcommit_ai.core.cache import ResponseCache
 from gitcommit_ai.generator.message import CommitMessage, FileDiff, GitDiff
 from gitcommit_ai.providers.openai import OpenAIProvider
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_diff() -> GitDiff:
-    """Create a sample GitDiff for testing."""
+    """Create a sample GitDiff shared read-only by the tests in this module."""
     return GitDiff(
         files=[
             FileDiff(
@@ -25,12 +31,54 @@ def sample_diff() -> GitDiff:
     )
 
 
+@pytest.fixture
+def openai_provider() -> OpenAIProvider:
+    """Create an OpenAIProvider with a test API key."""
+    return OpenAIProvider(api_key="sk-test123")
+
+
+@pytest.fixture(scope="module")
+async def _mock_api_client() -> AsyncIterator[tuple[httpx.AsyncClient, MagicMock]]:
+    """Build one MockTransport-backed client for the whole module."""
+    handler = MagicMock()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield client, handler
+    await client.aclose()
+
+
+@pytest.fixture
+def mock_api(
+    _mock_api_client: tuple[httpx.AsyncClient, MagicMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> MagicMock:
+    """Serve the shared client from an httpx.MockTransport.
+
+    The returned mock is called with each outgoing httpx.Request; set its
+    return_value or side_effect to the httpx.Response(s) to send back.
+    """
+    client, handler = _mock_api_client
+    handler.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(OpenAIProvider, "_get_client", classmethod(lambda cls: client))
+    return handler
+
+
+@pytest.fixture
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace asyncio.sleep so retry backoff does not block the test."""
+    mock = AsyncMock()
+    monkeypatch.setattr("asyncio.sleep", mock)
+    return mock
+
+
 class TestOpenAIProvider:
     """Test OpenAI commit message generation."""
 
     @pytest.mark.asyncio
     async def test_generate_commit_message_success(
-        self, sample_diff: GitDiff
+        self,
+        sample_diff: GitDiff,
+        openai_provider: OpenAIProvider,
+        mock_api: MagicMock,
     ) -> None:
         """Generates commit message from OpenAI API response."""
         mock_response = {
@@ -43,48 +91,232 @@ class TestOpenAIProvider:
                 }
             ]
         }
+        mock_api.return_value = httpx.Response(200, json=mock_response)
 
-        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = MagicMock(
-                status_code=200, json=lambda: mock_response
-            )
-
-            provider = OpenAIProvider(api_key="sk-test123")
-            message = await provider.generate_commit_message(sample_diff)
+        message = await openai_provider.generate_commit_message(sample_diff)
 
-            assert isinstance(message, CommitMessage)
-            assert message.type == "feat"
-            assert message.scope == "core"
-            assert "authentication" in message.description.lower()
+        assert isinstance(message, CommitMessage)
+        assert message.type == "feat"
+        assert message.scope == "core"
+        assert "authentication" in message.description.lower()
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "error_message", "expected_calls"),
+        [
+            (401, "Invalid API key", 1),  # Not retried
+            (429, "Rate limit exceeded", 3),
+            (503, "Service unavailable", 2),
+        ],
+    )
     async def test_generate_commit_message_api_error(
-        self, sample_diff: GitDiff
+        self,
+        sample_diff: GitDiff,
+        openai_provider: OpenAIProvider,
+        mock_api: MagicMock,
+        mock_sleep: AsyncMock,
+        status: int,
+        error_message: str,
+        expected_calls: int,
     ) -> None:
-        """Raises exception when API returns error."""
-        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = MagicMock(
-                status_code=429,  # Rate limit
-                json=lambda: {"error": {"message": "Rate limit exceeded"}},
-            )
+        """Raises API error message once the status's retry budget is spent."""
+        mock_api.side_effect = lambda request: httpx.Response(
+            status, json={"error": {"message": error_message}}
+        )
+
+        with pytest.raises(Exception, match=error_message):
+            await openai_provider.generate_commit_message(sample_diff)
 
-            provider = OpenAIProvider(api_key="sk-test123")
-            with pytest.raises(Exception, match="Rate limit"):
-                await provider.generate_commit_message(sample_diff)
+        assert mock_api.call_count == expected_calls
+        assert mock_sleep.await_count == expected_calls - 1
+
+    @pytest.mark.asyncio
+    async def test_generate_commit_message_retries_rate_limit(
+        self,
+        sample_diff: GitDiff,
+        openai_provider: OpenAIProvider,
+        mock_api: MagicMock,
+        mock_sleep: AsyncMock,
+    ) -> None:
+        """429 is retried, honouring Retry-After, until the call succeeds."""
+        mock_api.side_effect = [
+            httpx.Response(
+                429,
+                headers={"Retry-After": "1.5"},
+                json={"error": {"message": "Rate limit exceeded"}},
+            ),
+            httpx.Response(
+                200, json={"choices": [{"message": {"content": "feat: add retry"}}]}
+            ),
+        ]
+
+        message = await openai_provider.generate_commit_message(sample_diff)
+
+        assert message.description == "add retry"
+        assert mock_api.call_count == 2
+        mock_sleep.assert_awaited_once_with(1.5)
+
+    @pytest.mark.parametrize(
+        ("headers", "low", "high"),
+        [
+            ({}, 1.0, 1.3),  # No header: backoff with jitter
+            ({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, 1.0, 1.3),
+            ({"Retry-After": "120"}, 10.0, 10.0),  # Capped
+        ],
+    )
+    def test_retry_delay(
+        self,
+        openai_provider: OpenAIProvider,
+        headers: dict[str, str],
+        low: float,
+        high: float,
+    ) -> None:
+        """Retry-After seconds are honoured; anything else uses backoff."""
+        response = httpx.Response(429, headers=headers)
+
+        assert low <= openai_provider._retry_delay(response, attempt=1) <= high
 
     @pytest.mark.asyncio
     async def test_generate_commit_message_network_error(
-        self, sample_diff: GitDiff
+        self,
+        sample_diff: GitDiff,
+        openai_provider: OpenAIProvider,
+        mock_api: MagicMock,
     ) -> None:
         """Raises exception on network failure."""
-        with patch(
-            "httpx.AsyncClient.post", new_callable=AsyncMock
-        ) as mock_post:
-            mock_post.side_effect = Exception("Connection timeout")
+        mock_api.side_effect = httpx.ConnectTimeout("Connection timeout")
+
+        with pytest.raises(Exception, match="Connection timeout"):
+            await openai_provider.generate_commit_message(sample_diff)
+
+    @pytest.mark.asyncio
+    async def test_generate_commit_message_uses_cache(
+        self, sample_diff: GitDiff, mock_api: MagicMock, tmp_path
+    ) -> None:
+        """Second call with the same diff is served from cache."""
+        mock_response = {
+            "choices": [{"message": {"content": "fix(core): handle empty input"}}]
+        }
+        mock_api.return_value = httpx.Response(200, json=mock_response)
+
+        provider = OpenAIProvider(
+            api_key="sk-test123", cache=ResponseCache(cache_dir=tmp_path)
+        )
+        first = await provider.generate_commit_message(sample_diff)
+        second = await provider.generate_commit_message(sample_diff)
+
+        assert first == second
+        assert mock_api.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_message_is_not_cached(
+        self, sample_diff: GitDiff, mock_api: MagicMock, tmp_path
+    ) -> None:
+        """Non-conventional responses are returned but not stored."""
+        mock_api.side_effect = lambda request: httpx.Response(
+            200, json={"choices": [{"message": {"content": "Sorry, I cannot help"}}]}
+        )
+
+        cache = ResponseCache(cache_dir=tmp_path)
+        provider = OpenAIProvider(api_key="sk-test123", cache=cache)
+        message = await provider.generate_commit_message(sample_diff)
+        await provider.generate_commit_message(sample_diff)
 
-            provider = OpenAIProvider(api_key="sk-test123")
-            with pytest.raises(Exception, match="Connection timeout"):
-                await provider.generate_commit_message(sample_diff)
+        assert message.type == "chore"
+        assert mock_api.call_count == 2
+        assert cache.get(provider.model, provider._build_prompt(sample_diff), sample_diff) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_misses_same_shape_diff_with_different_content(
+        self, sample_diff: GitDiff, mock_api: MagicMock, tmp_path
+    ) -> None:
+        """Diffs with equal paths and line counts but new content are not reused."""
+        mock_api.side_effect = lambda request: httpx.Response(
+            200, json={"choices": [{"message": {"content": "fix(auth): update check"}}]}
+        )
+
+        provider = OpenAIProvider(
+            api_key="sk-test123", cache=ResponseCache(cache_dir=tmp_path)
+        )
+        changed = replace(
+            sample_diff, files=[replace(sample_diff.files[0], diff_content="@@ other @@")]
+        )
+        assert provider._build_prompt(sample_diff) == provider._build_prompt(changed)
+
+        await provider.generate_commit_message(sample_diff)
+        await provider.generate_commit_message(changed)
+
+        assert mock_api.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_explicit_temperature_bypasses_cache(
+        self, sample_diff: GitDiff, mock_api: MagicMock, tmp_path
+    ) -> None:
+        """Explicit temperatures are sent as-is and always hit the API."""
+        mock_api.side_effect = lambda request: httpx.Response(
+            200, json={"choices": [{"message": {"content": "feat: add x"}}]}
+        )
+
+        provider = OpenAIProvider(
+            api_key="sk-test123", cache=ResponseCache(cache_dir=tmp_path)
+        )
+        await provider.generate_commit_message(sample_diff, temperature=0.7)
+        await provider.generate_commit_message(sample_diff, temperature=0.7)
+
+        assert mock_api.call_count == 2
+        assert json.loads(mock_api.call_args.args[0].content)["temperature"] == 0.7
+
+    @pytest.mark.asyncio
+    async def test_generate_many_runs_each_model(
+        self, sample_diff: GitDiff, mock_api: MagicMock
+    ) -> None:
+        """generate_many returns one message per config, in order."""
+        def respond(request: httpx.Request) -> httpx.Response:
+            model = json.loads(request.content)["model"]
+            content = f"feat: message from {model}"
+            return httpx.Response(
+                200, json={"choices": [{"message": {"content": content}}]}
+            )
+
+        mock_api.side_effect = respond
+
+        messages = await OpenAIProvider.generate_many(
+            [("sk-test123", "gpt-4o-mini"), ("sk-test123", "gpt-4o")],
+            sample_diff,
+        )
+
+        assert [m.description for m in messages] == [
+            "message from gpt-4o-mini",
+            "message from gpt-4o",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generate_commit_message_request_format(
+        self,
+        sample_diff: GitDiff,
+        openai_provider: OpenAIProvider,
+        mock_api: MagicMock,
+    ) -> None:
+        """Request carries auth header, system prompt and user prompt."""
+        mock_api.return_value = httpx.Response(
+            200, json={"choices": [{"message": {"content": "feat: add x"}}]}
+        )
+
+        await openai_provider.generate_commit_message(sample_diff)
+
+        request = mock_api.call_args.args[0]
+        body = json.loads(request.content)
+        assert str(request.url) == openai_provider.api_url
+        assert request.headers["Authorization"] == "Bearer sk-test123"
+        assert request.headers["Content-Type"] == "application/json"
+        assert body["temperature"] == 0.2
+        assert body["max_tokens"] == 200
+        system, user = body["messages"]
+        assert system["role"] == "system"
+        assert user == {
+            "role": "user",
+            "content": openai_provider._build_prompt(sample_diff),
+        }
 
 
 class TestOpenAIValidation:
@@ -129,3 +361,130 @@ class TestOpenAIPromptBuilding:
         assert any(
             t in prompt.lower() for t in ["feat", "fix", "docs", "refactor"]
         )
+
+    def test_build_prompt_reads_template_once(
+        self, sample_diff: GitDiff, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Template file is loaded once and reused by later prompts."""
+        monkeypatch.setattr(OpenAIProvider, "_loader", None)
+        monkeypatch.setattr(OpenAIProvider, "_template", None)
+
+        with patch(
+            "gitcommit_ai.providers.openai.PromptLoader.load", return_value="{file_list}"
+        ) as mock_load:
+            OpenAIProvider(api_key="sk-test123")._build_prompt(sample_diff)
+            OpenAIProvider(api_key="sk-test456")._build_prompt(sample_diff)
+
+        assert mock_load.call_count == 1
+
+
+class TestOpenAIMessageParsing:
+    """Test parsing of OpenAI responses into CommitMessage."""
+
+    def test_parse_message_with_body(self) -> None:
+        """Header and body are split on the first blank line."""
+        provider = OpenAIProvider(api_key="sk-test123")
+        message = provider._parse_message("feat(api): add endpoint\n\nAdds /v2/users.")
+
+        assert message.type == "feat"
+        assert message.scope == "api"
+        assert message.description == "add endpoint"
+        assert message.body == "Adds /v2/users."
+
+    def test_parse_message_strips_code_fence(self) -> None:
+        """Code fences around the message are ignored."""
+        provider = OpenAIProvider(api_key="sk-test123")
+        message = provider._parse_message("```\nfix: handle null user\n```")
+
+        assert message.type == "fix"
+        assert message.description == "handle null user"
+
+    def test_parse_message_strips_label(self) -> None:
+        """A leading 'Commit message:' label is ignored."""
+        provider = OpenAIProvider(api_key="sk-test123")
+        message = provider._parse_message("Commit message:\ndocs: update readme")
+
+        assert message.type == "docs"
+        assert message.description == "update readme"
+
+    def test_parse_message_without_colon_falls_back(self) -> None:
+        """Responses with no header fall back to a chore message."""
+        provider = OpenAIProvider(api_key="sk-test123")
+        message = provider._parse_message(
+            "Sorry, I cannot determine the change\n" + "x" * 5000
+        )
+
+        assert message.type == "chore"
+        assert message.description == "Sorry, I cannot determine the change"
+
+    def test_parse_message_does_not_compile_regexes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parsing uses the precompiled class patterns, never the re helpers."""
+        provider = OpenAIProvider(api_key="sk-test123")
+        helpers = {}
+        for name in ("compile", "match", "fullmatch", "search", "sub"):
+            helpers[name] = MagicMock(side_effect=AssertionError(f"re.{name} called"))
+            monkeypatch.setattr(re, name, helpers[name])
+
+        message = provider._parse_message("```\nfeat(api): add endpoint\n\nBody.\n```")
+
+        assert message.description == "add endpoint"
+        for helper in helpers.values():
+            helper.assert_not_called()
+
+
+class TestOpenAIConnectionPooling:
+    """Test shared HTTP client reuse across calls."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_instances(self) -> None:
+        """Providers share one pooled client within an event loop."""
+        first = OpenAIProvider(api_key="sk-test123")._get_client()
+        second = OpenAIProvider(api_key="sk-test456")._get_client()
+
+        assert first is second
+        await OpenAIProvider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_client(self) -> None:
+        """Closing the shared client forces a fresh one on next use."""
+        client = OpenAIProvider._get_client()
+        await OpenAIProvider.aclose()
+
+        assert client.is_closed
+        assert OpenAIProvider._get_client() is not client
+        await OpenAIProvider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warmup_opens_connection(self) -> None:
+        """Warm-up sends a cheap request through the shared client."""
+        with patch("httpx.AsyncClient.head", new_callable=AsyncMock) as mock_head:
+            OpenAIProvider.start_warmup()
+            await OpenAIProvider._warmup_task
+
+            mock_head.assert_called_once()
+            assert mock_head.call_args.args[0].startswith(OpenAIProvider.API_BASE)
+        await OpenAIProvider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_network_errors(self) -> None:
+        """Failed warm-up does not raise."""
+        with patch(
+            "httpx.AsyncClient.head",
+            new_callable=AsyncMock,
+            side_effect=httpx.ConnectError("offline"),
+        ):
+            OpenAIProvider.start_warmup()
+            await OpenAIProvider._warmup_task
+        await OpenAIProvider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_pending_warmup(self) -> None:
+        """Shutdown cancels a warm-up that has not finished."""
+        with patch("httpx.AsyncClient.head", new_callable=AsyncMock):
+            OpenAIProvider.start_warmup()
+            task = OpenAIProvider._warmup_task
+            await OpenAIProvider.aclose()
+
+        assert task.cancelled()
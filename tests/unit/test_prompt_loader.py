@@ -27,15 +27,17 @@ class TestPromptLoaderBasics:
         with pytest.raises(FileNotFoundError, match="nonexistent"):
             loader.load("nonexistent")
 
-    def test_loads_all_provider_templates(self) -> None:
+    @pytest.mark.parametrize(
+        "provider",
+        ["openai", "anthropic", "deepseek", "ollama", "gemini", "mistral", "cohere"],
+    )
+    def test_loads_all_provider_templates(self, provider: str) -> None:
         """T201: All 7 providers have templates."""
         loader = PromptLoader()
-        providers = ["openai", "anthropic", "deepseek", "ollama", "gemini", "mistral", "cohere"]
+        template = loader.load(provider)
 
-        for provider in providers:
-            template = loader.load(provider)
-            assert template is not None
-            assert len(template) > 0
+        assert template is not None
+        assert len(template) > 0
 
 
 class TestPromptLoaderUserOverrides:
@@ -3,6 +3,7 @@ from abc import ABC
 
 import pytest
 
+from gitcommit_ai.generator.message import CommitMessage, GitDiff
 from gitcommit_ai.providers.base import AIProvider
 
 
@@ -31,8 +32,6 @@ class ConcreteProvider(AIProvider):
 
     async def generate_commit_message(self, diff):  # type: ignore
         """Dummy implementation."""
-        from gitcommit_ai.generator.message import CommitMessage
-
         return CommitMessage(
             type="test",
             scope=None,
@@ -58,8 +57,6 @@ class TestConcreteProvider:
     @pytest.mark.asyncio
     async def test_concrete_provider_can_generate_message(self) -> None:
         """Concrete provider can generate commit messages."""
-        from gitcommit_ai.generator.message import GitDiff
-
         provider = ConcreteProvider()
         diff = GitDiff(files=[], total_additions=0, total_deletions=0)
         message = await provider.generate_commit_message(diff)
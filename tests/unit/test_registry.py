@@ -1,7 +1,7 @@
 """Tests for provider registry."""
 from unittest.mock import patch
 
-from gitcommit_ai.providers.registry import ProviderInfo, ProviderRegistry
+from gitcommit_ai.providers.registry import ProviderInfo, ProviderRegistry, _ollama_on_path
 
 
 class TestProviderRegistry:
@@ -45,6 +45,15 @@ class TestProviderRegistry:
             assert len(provider.models) > 0
             assert isinstance(provider.description, str)
 
+    def test_models_are_shared_immutable_tuples(self) -> None:
+        """Model lists are module-level tuples, not rebuilt per call."""
+        first = ProviderRegistry.list_providers()
+        second = ProviderRegistry.list_providers()
+
+        for a, b in zip(first, second):
+            assert isinstance(a.models, tuple)
+            assert a.models is b.models
+
     def test_get_provider_names(self) -> None:
         """Returns list of all provider names."""
         names = ProviderRegistry.get_provider_names()
@@ -52,6 +61,19 @@ class TestProviderRegistry:
         assert len(names) >= 6
         assert all(isinstance(name, str) for name in names)
 
+    def test_get_provider_names_matches_list_providers(self) -> None:
+        """Static name list stays in sync with full provider info."""
+        names = ProviderRegistry.get_provider_names()
+        assert names == [p.name for p in ProviderRegistry.list_providers()]
+
+    def test_get_provider_names_skips_configuration_checks(self) -> None:
+        """Listing names does not probe env vars or ollama."""
+        with patch(
+            "gitcommit_ai.providers.registry.ProviderRegistry._is_configured"
+        ) as mock_configured:
+            ProviderRegistry.get_provider_names()
+            mock_configured.assert_not_called()
+
     def test_get_configured_providers(self) -> None:
         """Returns only configured providers."""
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
@@ -70,33 +92,33 @@ class TestProviderRegistry:
 class TestOllamaDetection:
     """Test Ollama installation detection."""
 
-    def test_check_ollama_returns_true_when_installed(self) -> None:
-        """Returns True when ollama command exists."""
-        import subprocess
+    def setup_method(self) -> None:
+        """Reset the cached PATH lookup between tests."""
+        _ollama_on_path.cache_clear()
 
-        mock_result = subprocess.CompletedProcess(
-            args=["ollama", "--version"],
-            returncode=0,
-            stdout="ollama version 0.1.0"
-        )
+    def teardown_method(self) -> None:
+        """Drop results computed under mocked PATH lookups."""
+        _ollama_on_path.cache_clear()
 
-        with patch("subprocess.run", return_value=mock_result):
+    def test_check_ollama_returns_true_when_installed(self) -> None:
+        """Returns True when ollama binary is on PATH."""
+        with patch("shutil.which", return_value="/usr/local/bin/ollama"):
             assert ProviderRegistry._check_ollama() is True
 
     def test_check_ollama_returns_false_when_not_found(self) -> None:
-        """Returns False when ollama command not found."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        """Returns False when ollama binary is not on PATH."""
+        with patch("shutil.which", return_value=None):
             assert ProviderRegistry._check_ollama() is False
 
-    def test_check_ollama_returns_false_on_error(self) -> None:
-        """Returns False when ollama command fails."""
-        import subprocess
-
-        mock_result = subprocess.CompletedProcess(
-            args=["ollama", "--version"],
-            returncode=1,
-            stdout=""
-        )
-
-        with patch("subprocess.run", return_value=mock_result):
-            assert ProviderRegistry._check_ollama() is False
+    def test_check_ollama_does_not_spawn_process(self) -> None:
+        """Detection never forks the ollama binary."""
+        with patch("subprocess.run") as mock_run:
+            ProviderRegistry._check_ollama()
+            mock_run.assert_not_called()
+
+    def test_check_ollama_is_cached(self) -> None:
+        """PATH is searched only once per process."""
+        with patch("shutil.which", return_value=None) as mock_which:
+            ProviderRegistry._check_ollama()
+            ProviderRegistry._check_ollama()
+            assert mock_which.call_count == 1
@@ -61,3 +61,11 @@ class TestCommitValidator:
 
         assert is_valid is False
         assert "Missing description" in issues[0]
+
+    def test_validate_conventional_rejects_missing_space_after_colon(self) -> None:
+        """Rejects commit whose colon is not followed by a space."""
+        validator = CommitValidator()
+        is_valid, issues = validator.validate_conventional("feat:add feature")
+
+        assert is_valid is False
+        assert len(issues) > 0